@@ -35,6 +35,20 @@ class TestChatbot(unittest.TestCase):
         response = get_bot_response("random text")
         self.assertEqual(response, RESPONSES["default"])
     
+    def test_keyword_within_sentence(self):
+        """Test keywords embedded in longer messages."""
+        self.assertEqual(get_bot_response("well, hello there!"), RESPONSES["greeting"])
+        self.assertEqual(get_bot_response("ok see you later"), RESPONSES["farewell"])
+        self.assertEqual(get_bot_response("안녕히 계세요"), RESPONSES["farewell"])
+        self.assertEqual(get_bot_response("can you help me?"), RESPONSES["help"])
+    
+    def test_keyword_priority(self):
+        """Test help > farewell > greeting priority on overlapping keywords."""
+        self.assertEqual(get_bot_response("안녕히"), RESPONSES["farewell"])
+        self.assertEqual(get_bot_response("hello, bye"), RESPONSES["farewell"])
+        self.assertEqual(get_bot_response("help, bye"), RESPONSES["help"])
+        self.assertEqual(get_bot_response("안녕 도움"), RESPONSES["help"])
+    
     def test_case_insensitive(self):
         """Test case insensitive matching."""
         self.assertEqual(get_bot_response("HELLO"), RESPONSES["greeting"])